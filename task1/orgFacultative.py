@@ -2,6 +2,8 @@ import json
 import re
 
 class Person:
+    __slots__ = ('_first_name', '_last_name', '_patronymic', '_address')
+
     def __init__(self, first_name: str, last_name: str, patronymic: str | None, address: str):
         self._first_name = self.validate_name(first_name)
         self._last_name = self.validate_name(last_name)
@@ -83,6 +85,8 @@ class Person:
 
 
 class Student(Person):
+    __slots__ = ('_student_id', '_phone', '_min_required_facultative_hours')
+
     def __init__(self, *args, **kwargs):
         if len(args) == 1:
             arg = args[0]
@@ -0,0 +1,82 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List
+from student import Student
+from student_filter import StudentFilter, StudentSort
+from student_rep_db import StudentRepDB, DB_CONFIG
+
+
+class AsyncStudentRepDB:
+    def __init__(self, db_repo: StudentRepDB | None = None, max_workers: int | None = None,
+                 batch_size: int = 1000):
+        self._db_repo = db_repo or StudentRepDB(batch_size)
+        self._batch_size = batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or DB_CONFIG.get('pool_max_size', 10),
+            thread_name_prefix='student-db'
+        )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def get_by_id(self, student_id: int) -> Student | None:
+        return await self._run(self._db_repo.get_by_id, student_id)
+
+    async def get_by_ids(self, student_ids: List[int], use_cache: bool = True) -> List[Student]:
+        return await self._run(self._db_repo.get_by_ids, list(student_ids), use_cache)
+
+    async def get_k_n_short_list(self, k: int, n: int, student_filter: StudentFilter | None = None,
+                                 student_sort: StudentSort | None = None) -> List[Student]:
+        return await self._run(self._db_repo.get_k_n_short_list, k, n, student_filter, student_sort)
+
+    async def get_k_after_id(self, k: int, after_id: int | None = None,
+                             student_filter: StudentFilter | None = None) -> List[Student]:
+        return await self._run(self._db_repo.get_k_after_id, k, after_id, student_filter)
+
+    async def get_k_after_name(self, k: int, after: tuple | None = None,
+                               student_filter: StudentFilter | None = None) -> List[Student]:
+        return await self._run(self._db_repo.get_k_after_name, k, after, student_filter)
+
+    async def iter_all(self, batch_size: int | None = None, by_name: bool = False, after=None,
+                       student_filter: StudentFilter | None = None):
+        batch_size = batch_size or self._batch_size
+        cursor = after
+        while True:
+            if by_name:
+                page = await self.get_k_after_name(batch_size, cursor, student_filter)
+            else:
+                page = await self.get_k_after_id(batch_size, cursor, student_filter)
+            for student in page:
+                yield student
+            if len(page) < batch_size:
+                return
+            cursor = StudentRepDB.name_key(page[-1]) if by_name else page[-1].student_id
+
+    async def add_student(self, student_data: dict) -> Student:
+        return await self._run(self._db_repo.add_student, student_data)
+
+    async def update_student(self, student_id: int, student_data: dict) -> Student | None:
+        return await self._run(self._db_repo.update_student, student_id, student_data)
+
+    async def delete_student(self, student_id: int) -> bool:
+        return await self._run(self._db_repo.delete_student, student_id)
+
+    async def get_count(self, student_filter: StudentFilter | None = None) -> int:
+        return await self._run(self._db_repo.get_count, student_filter)
+
+    async def write_all(self, students: List[Student], mode: str = 'truncate') -> None:
+        await self._run(self._db_repo.write_all, students, mode)
+
+    async def pipeline(self, *operations) -> list:
+        return await asyncio.gather(*operations)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncStudentRepDB':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,40 @@
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from student import Student
+
+
+def make_students(count: int) -> list:
+    return [
+        Student(f"{i + 1};Иван;Петров;{'Сергеевич' if i % 2 else ''};"
+                f"г. Краснодар, ул. Красная, д. {i % 200 + 1};+7{i:010d};{i % 40}")
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory used by Student objects")
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    students = make_students(args.count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"students:        {len(students)}")
+    print(f"total:           {current / 1024 / 1024:.1f} MiB")
+    print(f"peak:            {peak / 1024 / 1024:.1f} MiB")
+    print(f"per student:     {current / len(students):.0f} B")
+    instance_size = sys.getsizeof(students[0])
+    if hasattr(students[0], '__dict__'):
+        instance_size += sys.getsizeof(students[0].__dict__)
+    print(f"Student object:  {instance_size} B")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ('psycopg2', 'yaml', 'numpy')
+
+PROBE = """
+import json, os, sys, tempfile, time
+sys.path.insert(0, {bench_dir!r})
+import package_path
+package_path.install()
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'elapsed': elapsed, 'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+SCENARIOS = {
+    'json': (
+        "from student_repository import StudentRepJson\n"
+        "StudentRepJson(os.path.join(tempfile.mkdtemp(), 'students.json'))",
+        ()
+    ),
+    'adapter_import': (
+        "import student_rep_db_adapter",
+        ()
+    ),
+    'db_repository': (
+        "from student_rep_db import StudentRepDB\n"
+        "StudentRepDB()",
+        ()
+    ),
+    'yaml': (
+        "from student_repository import StudentRepYaml\n"
+        "StudentRepYaml(os.path.join(tempfile.mkdtemp(), 'students.yaml')).write_all([])",
+        ('yaml',)
+    ),
+}
+
+
+def run_probe(code: str) -> dict:
+    probe = PROBE.format(bench_dir=BENCH_DIR, code=code, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', probe], check=True, capture_output=True,
+                            text=True, env=os.environ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup time and heavy imports per entry point")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scenarios', nargs='+', default=sorted(SCENARIOS), choices=sorted(SCENARIOS))
+    args = parser.parse_args()
+
+    failures = []
+    for name in args.scenarios:
+        code, allowed = SCENARIOS[name]
+        runs = [run_probe(code) for _ in range(args.repeat)]
+        loaded = sorted(set().union(*(run['loaded'] for run in runs)))
+        unexpected = [module for module in loaded if module not in allowed]
+        median_ms = statistics.median(run['elapsed'] for run in runs) * 1000
+        print(f"{name:16} {median_ms:8.1f} ms  loaded: {', '.join(loaded) or '-'}")
+        if unexpected:
+            failures.append((name, unexpected))
+
+    for name, modules in failures:
+        print(f"{name}: unexpected imports {', '.join(modules)}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(BENCH_DIR)), 'task1'))
+
+import orgFacultative
+import student
+
+FIRST_NAMES = ['Иван', 'Петр', 'Анна', 'Мария', 'Олег', 'Елена', 'Сергей', 'Ольга']
+LAST_NAMES = ['Иванов', 'Петров', 'Сидоров', 'Кузнецов', 'Смирнов', 'Попов', 'Волков', 'Соколов']
+PATRONYMICS = ['Иванович', 'Петрович', 'Сергеевна', None]
+STREETS = ['ул. Красная', 'ул. Северная', 'пр. Мира', 'бульвар Победы', 'пер. Школьный']
+CITIES = ['Респ. Адыгея, г. Майкоп', 'Краснодарский Край, г. Сочи',
+          'Ростовская Обл., ст-ца Вешенская', 'г. Краснодар']
+
+
+def make_records(count: int, addresses: int, seed: int = 1) -> list:
+    rnd = random.Random(seed)
+    address_pool = [
+        f"{rnd.choice(CITIES)}, {rnd.choice(STREETS)}, д. {rnd.randint(1, 200)}"
+        for _ in range(addresses)
+    ]
+    return [
+        (i + 1, rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES), rnd.choice(PATRONYMICS),
+         rnd.choice(address_pool), f"+7{rnd.randrange(10 ** 10):010d}", rnd.randint(0, 40))
+        for i in range(count)
+    ]
+
+
+def measure(student_class, records: list) -> float:
+    started = time.perf_counter()
+    for record in records:
+        student_class(*record)
+    return len(records) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Student constructions per second")
+    parser.add_argument('--count', type=int, default=200_000)
+    parser.add_argument('--addresses', type=int, default=2_000,
+                        help="number of distinct addresses shared by the students")
+    args = parser.parse_args()
+
+    records = make_records(args.count, args.addresses)
+    before = measure(orgFacultative.Student, records)
+    student._normalize_name.cache_clear()
+    student._check_address.cache_clear()
+    after = measure(student.Student, records)
+
+    print(f"students:        {args.count} ({args.addresses} distinct addresses)")
+    print(f"before (task1):  {before:,.0f} constructions/s")
+    print(f"after (task2):   {after:,.0f} constructions/s")
+    print(f"speedup:         {after / before:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import random
+from typing import List
+
+FIRST_NAMES = ['Иван', 'Петр', 'Сергей', 'Алексей', 'Дмитрий', 'Олег', 'Михаил', 'Никита',
+               'Анна', 'Мария', 'Елена', 'Ольга', 'Татьяна', 'Наталья', 'Ирина', 'Дарья']
+LAST_NAMES = ['Иванов', 'Петров', 'Сидоров', 'Кузнецов', 'Смирнов', 'Попов', 'Волков', 'Соколов',
+              'Лебедев', 'Козлов', 'Новиков', 'Морозов', 'Павлов', 'Семенов', 'Голубев', 'Римский-Корсаков']
+PATRONYMICS = ['Иванович', 'Петрович', 'Сергеевич', 'Алексеевич', 'Дмитриевич', None]
+FEMALE_PATRONYMICS = ['Ивановна', 'Петровна', 'Сергеевна', 'Алексеевна', 'Дмитриевна', None]
+
+REGIONS = ['Респ. Адыгея', 'Краснодарский Край', 'Ростовская Обл.', 'Респ. Крым', 'Ставропольский Край', None]
+LOCATIONS = ['г. Краснодар', 'г. Майкоп', 'ст-ца Вешенская', 'с. Дивное', 'а. Хакуринохабль', 'г. Сочи']
+STREET_TYPES = ['ул.', 'улица', 'пр.', 'проспект', 'бульвар', 'переулок', 'пер.', 'аллея', 'шоссе']
+STREET_NAMES = ['Красная', 'Северная', 'Мира', 'Победы', 'Школьная', 'Садовая', 'Ленина', 'Гагарина']
+HOUSE_TYPES = ['д.', 'дом']
+
+
+def _feminine(last_name: str) -> str:
+    return last_name + 'а' if last_name.endswith(('ов', 'ев', 'ин')) else last_name
+
+
+def make_address(rnd: random.Random) -> str:
+    parts = []
+    region = rnd.choice(REGIONS)
+    if region:
+        parts.append(region)
+    parts.append(rnd.choice(LOCATIONS))
+    parts.append(f"{rnd.choice(STREET_TYPES)} {rnd.choice(STREET_NAMES)}")
+    parts.append(f"{rnd.choice(HOUSE_TYPES)} {rnd.randint(1, 250)}")
+    return ', '.join(parts)
+
+
+def make_records(count: int, seed: int = 1, addresses: int | None = None) -> List[dict]:
+    rnd = random.Random(seed)
+    address_pool = [make_address(rnd) for _ in range(addresses)] if addresses else None
+    records = []
+    for i in range(count):
+        female = rnd.random() < 0.5
+        first_name = rnd.choice(FIRST_NAMES[8:] if female else FIRST_NAMES[:8])
+        last_name = rnd.choice(LAST_NAMES)
+        records.append({
+            'student_id': i + 1,
+            'first_name': first_name,
+            'last_name': _feminine(last_name) if female else last_name,
+            'patronymic': rnd.choice(FEMALE_PATRONYMICS if female else PATRONYMICS),
+            'address': rnd.choice(address_pool) if address_pool else make_address(rnd),
+            'phone': f"+7{rnd.randrange(10 ** 10):010d}" if rnd.random() < 0.9 else None,
+            'min_required_facultative_hours': rnd.randint(0, 72)
+        })
+    return records
+
+
+def as_row(record: dict) -> tuple:
+    return (record['student_id'], record['first_name'], record['last_name'], record['patronymic'],
+            record['address'], record['phone'], record['min_required_facultative_hours'])
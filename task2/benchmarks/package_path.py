@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import sys
+from importlib.machinery import SourceFileLoader
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Модули пакета, которые лежат в файлах без расширения .py
+EXTENSIONLESS_MODULES = ('student_repository', 'student_rep_db')
+
+
+class ExtensionlessFinder:
+    @staticmethod
+    def find_spec(name: str, path=None, target=None):
+        if name not in EXTENSIONLESS_MODULES:
+            return None
+        filename = os.path.join(PACKAGE_DIR, name)
+        if not os.path.isfile(filename):
+            return None
+        return importlib.util.spec_from_loader(name, SourceFileLoader(name, filename))
+
+
+def install() -> None:
+    if PACKAGE_DIR not in sys.path:
+        sys.path.insert(0, PACKAGE_DIR)
+    # В конце списка: обычный student_repository.py, если он есть, найдется раньше
+    if ExtensionlessFinder not in sys.meta_path:
+        sys.meta_path.append(ExtensionlessFinder)
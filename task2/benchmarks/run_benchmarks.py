@@ -0,0 +1,270 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import package_path
+
+package_path.install()
+
+from data_gen import make_records, as_row
+from decorators import StudentRepFileDecorator
+from student import Student
+from student_filter import StudentFilter, StudentSort
+from student_repository import StudentRepJson, StudentRepYaml, StudentRepJournal, StudentRepBinary
+
+BENCHMARKS = {}
+LATENCY_SAMPLES = 200
+PAGES = 50
+PAGE_SIZE = 20
+
+
+def benchmark(name: str):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def percentiles(samples: list) -> dict:
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {'p50_ms': pick(0.50), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99)}
+
+
+def measure_latency(operation, arguments) -> dict:
+    samples = []
+    for argument in arguments:
+        started = time.perf_counter()
+        operation(argument)
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def measure_throughput(operation, count: int) -> tuple:
+    started = time.perf_counter()
+    result = operation()
+    elapsed = time.perf_counter() - started
+    return result, elapsed, count / elapsed if elapsed else 0.0
+
+
+def measure_peak_memory(operation) -> tuple:
+    tracemalloc.start()
+    try:
+        result = operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak / 1024 / 1024
+
+
+def sample_ids(size: int) -> list:
+    step = max(size // LATENCY_SAMPLES, 1)
+    return list(range(1, size + 1, step))[:LATENCY_SAMPLES]
+
+
+def new_student_data(record: dict) -> dict:
+    data = dict(record)
+    del data['student_id']
+    return data
+
+
+@benchmark('model')
+def bench_model(size: int, context: dict) -> dict:
+    records = context['records']
+    rows = [as_row(record) for record in records]
+    _, elapsed, validated = measure_throughput(lambda: [Student(**record) for record in records], size)
+    _, _, trusted = measure_throughput(lambda: Student.from_rows(rows), size)
+    _, peak = measure_peak_memory(lambda: Student.from_rows(rows))
+    return {
+        'construct_per_s': validated,
+        'from_row_per_s': trusted,
+        'objects_peak_mib': peak
+    }
+
+
+def bench_file_backend(repository_class, suffix: str, size: int, context: dict) -> dict:
+    students = context['students']
+    filename = os.path.join(context['workdir'], f"students_{size}{suffix}")
+    for path in (filename, filename + '.snapshot'):
+        if os.path.exists(path):
+            os.remove(path)
+
+    repository = repository_class(filename)
+    _, save_s, save_rate = measure_throughput(lambda: repository.write_all(students), size)
+    if isinstance(repository, StudentRepJournal):
+        repository.compact()
+
+    (repository, load_s, load_rate) = measure_throughput(lambda: repository_class(filename), size)
+    _, load_peak = measure_peak_memory(lambda: repository_class(filename))
+
+    metrics = {
+        'save_s': save_s,
+        'save_per_s': save_rate,
+        'load_s': load_s,
+        'load_per_s': load_rate,
+        'load_peak_mib': load_peak
+    }
+    for key, value in measure_latency(repository.get_by_id, sample_ids(size)).items():
+        metrics[f'get_by_id_{key}'] = value
+
+    new_records = context['records'][:min(LATENCY_SAMPLES, 20)]
+    for key, value in measure_latency(lambda record: repository.add_student(new_student_data(record)),
+                                      new_records).items():
+        metrics[f'add_student_{key}'] = value
+
+    decorator = StudentRepFileDecorator(repository, StudentFilter().hours_between(10, 50), StudentSort.by_name())
+    started = time.perf_counter()
+    for page in range(1, PAGES + 1):
+        decorator.get_k_n_short_list(PAGE_SIZE, page)
+    metrics['decorator_50_pages_s'] = time.perf_counter() - started
+    return metrics
+
+
+@benchmark('json')
+def bench_json(size: int, context: dict) -> dict:
+    return bench_file_backend(StudentRepJson, '.json', size, context)
+
+
+@benchmark('jsonl')
+def bench_jsonl(size: int, context: dict) -> dict:
+    return bench_file_backend(StudentRepJson, '.jsonl', size, context)
+
+
+@benchmark('yaml')
+def bench_yaml(size: int, context: dict) -> dict:
+    return bench_file_backend(StudentRepYaml, '.yaml', size, context)
+
+
+@benchmark('journal')
+def bench_journal(size: int, context: dict) -> dict:
+    return bench_file_backend(StudentRepJournal, '.log', size, context)
+
+
+@benchmark('binary')
+def bench_binary(size: int, context: dict) -> dict:
+    return bench_file_backend(StudentRepBinary, '.bin', size, context)
+
+
+@benchmark('db')
+def bench_db(size: int, context: dict) -> dict:
+    from decorators import StudentRepDBDecorator
+    from student_rep_db import StudentRepDB
+
+    repository = StudentRepDB()
+    students = context['students']
+    _, write_s, write_rate = measure_throughput(lambda: repository.write_all(students), size)
+    metrics = {'write_all_s': write_s, 'write_all_per_s': write_rate}
+
+    latency_groups = {
+        'get_by_id': measure_latency(repository.get_by_id, sample_ids(size)),
+        'page_offset': measure_latency(lambda n: repository.get_k_n_short_list(PAGE_SIZE, n),
+                                       [max(size // PAGE_SIZE, 1)] * 20),
+        'page_keyset': measure_latency(lambda after: repository.get_k_after_id(PAGE_SIZE, after),
+                                       [max(size - PAGE_SIZE, 0)] * 20),
+        'add_student': measure_latency(lambda record: repository.add_student(new_student_data(record)),
+                                       context['records'][:50]),
+        'update_student': measure_latency(
+            lambda record: repository.update_student(record['student_id'], new_student_data(record)),
+            context['records'][:50]),
+    }
+    for group, values in latency_groups.items():
+        for key, value in values.items():
+            metrics[f'{group}_{key}'] = value
+
+    decorator = StudentRepDBDecorator(repository, StudentFilter().hours_between(10, 50), StudentSort.by_name())
+    started = time.perf_counter()
+    for page in range(1, PAGES + 1):
+        decorator.get_k_n_short_list(PAGE_SIZE, page)
+    metrics['decorator_50_pages_s'] = time.perf_counter() - started
+    return metrics
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith('_per_s')
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, sizes in results['benchmarks'].items():
+        for size, metrics in sizes.items():
+            previous = baseline.get('benchmarks', {}).get(name, {}).get(size, {})
+            for metric, value in metrics.items():
+                old = previous.get(metric)
+                if not old:
+                    continue
+                change = (value - old) / old
+                worse = -change if higher_is_better(metric) else change
+                marker = 'REGRESSION' if worse > threshold else ''
+                print(f"{name:8} {size:>8} {metric:28} {old:14.4f} -> {value:14.4f} {change:+8.1%} {marker}")
+                if marker:
+                    regressions.append((name, size, metric, change))
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    for name, sizes in results['benchmarks'].items():
+        for size, metrics in sizes.items():
+            print(f"\n[{name}] {size} students")
+            for metric, value in metrics.items():
+                print(f"  {metric:28} {value:14.4f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks for the student model and repositories")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--backends', nargs='+', default=['model', 'json', 'jsonl', 'yaml', 'journal', 'binary'],
+                        choices=sorted(BENCHMARKS))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="previous results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="relative slowdown reported as a regression")
+    parser.add_argument('--db-host', help="override DB_CONFIG host for the 'db' backend")
+    args = parser.parse_args()
+
+    if args.db_host:
+        from student_rep_db import DB_CONFIG
+        DB_CONFIG['host'] = args.db_host
+
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'benchmarks': {}
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            records = make_records(size, args.seed)
+            context = {
+                'workdir': workdir,
+                'records': records,
+                'students': Student.from_rows([as_row(record) for record in records])
+            }
+            for name in args.backends:
+                print(f"running {name} @ {size}...", file=sys.stderr)
+                results['benchmarks'].setdefault(name, {})[str(size)] = BENCHMARKS[name](size, context)
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        print()
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,34 +1,135 @@
+from itertools import islice
 from typing import List, Callable
 from student import Student
+from student_filter import StudentFilter, StudentSort
+from instrumentation import instrumented
 
 
 class StudentRepDBDecorator:
     def __init__(self, db_repo, filter_func: Callable[[Student], bool] = None,
-                 sort_key: Callable[[Student], any] = None):
+                 sort_key: Callable[[Student], any] = None, batch_size: int = 1000):
         self._db_repo = db_repo
         self._filter_func = filter_func
         self._sort_key = sort_key
+        self._batch_size = batch_size
+
+        self._sql_filter = filter_func if isinstance(filter_func, StudentFilter) else None
+        self._py_filter = None if self._sql_filter else filter_func
+        can_sort_in_sql = isinstance(sort_key, StudentSort) and not self._py_filter
+        self._sql_sort = sort_key if can_sort_in_sql else None
+        self._py_sort = None if can_sort_in_sql else sort_key
+
+    def _iter_filtered(self, after_id: int | None = None):
+        students = self._db_repo.iter_all(self._batch_size, after=after_id, student_filter=self._sql_filter)
+        if self._py_filter:
+            students = filter(self._py_filter, students)
+        return students
 
+    @instrumented('decorator.db.get_k_n_short_list')
     def get_k_n_short_list(self, k: int, n: int) -> List[Student]:
-        students = self._db_repo.get_k_n_short_list(1000, 1)  # Получаем всех
+        if not self._py_filter and not self._py_sort:
+            return self._db_repo.get_k_n_short_list(k, n, self._sql_filter, self._sql_sort)
 
-        if self._filter_func:
-            students = list(filter(self._filter_func, students))
+        start_index = (n - 1) * k
+        end_index = start_index + k
+
+        if not self._py_sort:
+            return list(islice(self._iter_filtered(), start_index, end_index))
+
+        students = sorted(self._iter_filtered(), key=self._py_sort)
+        return students[start_index:end_index] if start_index < len(students) else []
+
+    @instrumented('decorator.db.get_page_after')
+    def get_page_after(self, k: int, after_id: int | None = None) -> List[Student]:
+        if not self._py_filter:
+            return self._db_repo.get_k_after_id(k, after_id, self._sql_filter)
 
+        return list(islice(self._iter_filtered(after_id), k))
+
+    @instrumented('decorator.db.get_by_ids')
+    def get_by_ids(self, student_ids: List[int]) -> List[Student]:
+        students = self._db_repo.get_by_ids(student_ids)
+        if self._filter_func:
+            students = [student for student in students if self._filter_func(student)]
         if self._sort_key:
             students.sort(key=self._sort_key)
+        return students
+
+    @instrumented('decorator.db.get_count', count_rows=False)
+    def get_count(self) -> int:
+        if not self._py_filter:
+            return self._db_repo.get_count(self._sql_filter)
+
+        return sum(1 for _ in self._iter_filtered())
+
+
+
+class AsyncStudentRepDBDecorator:
+    def __init__(self, db_repo, filter_func: Callable[[Student], bool] = None,
+                 sort_key: Callable[[Student], any] = None, batch_size: int = 1000):
+        self._db_repo = db_repo
+        self._filter_func = filter_func
+        self._sort_key = sort_key
+        self._batch_size = batch_size
+
+        self._sql_filter = filter_func if isinstance(filter_func, StudentFilter) else None
+        self._py_filter = None if self._sql_filter else filter_func
+        can_sort_in_sql = isinstance(sort_key, StudentSort) and not self._py_filter
+        self._sql_sort = sort_key if can_sort_in_sql else None
+        self._py_sort = None if can_sort_in_sql else sort_key
+
+    async def _iter_filtered(self, after_id: int | None = None):
+        async for student in self._db_repo.iter_all(self._batch_size, after=after_id,
+                                                    student_filter=self._sql_filter):
+            if not self._py_filter or self._py_filter(student):
+                yield student
+
+    async def _take(self, start_index: int, end_index: int, after_id: int | None = None) -> List[Student]:
+        students = []
+        position = 0
+        async for student in self._iter_filtered(after_id):
+            if position >= end_index:
+                break
+            if position >= start_index:
+                students.append(student)
+            position += 1
+        return students
+
+    async def get_k_n_short_list(self, k: int, n: int) -> List[Student]:
+        if not self._py_filter and not self._py_sort:
+            return await self._db_repo.get_k_n_short_list(k, n, self._sql_filter, self._sql_sort)
 
         start_index = (n - 1) * k
         end_index = start_index + k
+
+        if not self._py_sort:
+            return await self._take(start_index, end_index)
+
+        students = sorted([student async for student in self._iter_filtered()], key=self._py_sort)
         return students[start_index:end_index] if start_index < len(students) else []
 
-    def get_count(self) -> int:
-        students = self._db_repo.get_k_n_short_list(1000, 1)
+    async def get_page_after(self, k: int, after_id: int | None = None) -> List[Student]:
+        if not self._py_filter:
+            return await self._db_repo.get_k_after_id(k, after_id, self._sql_filter)
 
+        return await self._take(0, k, after_id)
+
+    async def get_by_ids(self, student_ids: List[int]) -> List[Student]:
+        students = await self._db_repo.get_by_ids(student_ids)
         if self._filter_func:
-            students = list(filter(self._filter_func, students))
+            students = [student for student in students if self._filter_func(student)]
+        if self._sort_key:
+            students.sort(key=self._sort_key)
+        return students
+
+    async def get_count(self) -> int:
+        if not self._py_filter:
+            return await self._db_repo.get_count(self._sql_filter)
 
-        return len(students)
+        count = 0
+        async for _ in self._iter_filtered():
+            count += 1
+        return count
 
 
 
@@ -38,8 +139,14 @@ class StudentRepFileDecorator:
         self._file_repo = file_repo
         self._filter_func = filter_func
         self._sort_key = sort_key
+        self._cached_version = None
+        self._cached_students = None
+
+    def _students(self) -> List[Student]:
+        version = getattr(self._file_repo, 'version', None)
+        if version is not None and version == self._cached_version:
+            return self._cached_students
 
-    def get_k_n_short_list(self, k: int, n: int) -> List[Student]:
         students = self._file_repo.read_all()
 
         if self._filter_func:
@@ -48,14 +155,21 @@ class StudentRepFileDecorator:
         if self._sort_key:
             students.sort(key=self._sort_key)
 
+        self._cached_version = version
+        self._cached_students = students
+        return students
+
+    def invalidate(self) -> None:
+        self._cached_version = None
+        self._cached_students = None
+
+    @instrumented('decorator.file.get_k_n_short_list')
+    def get_k_n_short_list(self, k: int, n: int) -> List[Student]:
+        students = self._students()
         start_index = (n - 1) * k
         end_index = start_index + k
         return students[start_index:end_index] if start_index < len(students) else []
 
+    @instrumented('decorator.file.get_count', count_rows=False)
     def get_count(self) -> int:
-        students = self._file_repo.read_all()
-
-        if self._filter_func:
-            students = list(filter(self._filter_func, students))
-
-        return len(students)
+        return len(self._students())
@@ -0,0 +1,197 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+
+class Histogram:
+    def __init__(self, buckets: tuple = BUCKETS_MS):
+        self._buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+
+    def observe(self, duration_ms: float, rows: int | None = None) -> None:
+        self.counts[bisect_left(self._buckets, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if rows is not None:
+            self.rows += rows
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self._buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'rows': self.rows,
+            'total_ms': self.total_ms,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'buckets': dict(zip(map(str, self._buckets), self.counts))
+        }
+
+
+class InMemoryExporter:
+    def __init__(self):
+        self.events = []
+        self.slow_events = []
+
+    def export(self, event: dict) -> None:
+        self.events.append(event)
+
+    def export_slow(self, event: dict) -> None:
+        self.slow_events.append(event)
+
+    def clear(self) -> None:
+        self.events.clear()
+        self.slow_events.clear()
+
+
+class LoggingExporter:
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG):
+        self._logger = logger or logging.getLogger('students.instrumentation')
+        self._level = level
+
+    def export(self, event: dict) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "%s %.3f ms rows=%s", event['operation'],
+                             event['duration_ms'], event['rows'])
+
+    def export_slow(self, event: dict) -> None:
+        self._logger.warning("slow %s %.3f ms rows=%s query=%s", event['operation'],
+                             event['duration_ms'], event['rows'], event['query'])
+
+
+class _Span:
+    __slots__ = ('rows',)
+
+    def __init__(self):
+        self.rows = None
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.slow_threshold_ms = None
+        self._exporters = []
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def enable(self, exporters: list | None = None, slow_threshold_ms: float | None = None) -> None:
+        with self._lock:
+            self._exporters = list(exporters or [])
+            self.slow_threshold_ms = slow_threshold_ms
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+
+    def record(self, operation: str, duration: float, rows: int | None = None, query: str | None = None) -> None:
+        duration_ms = duration * 1000
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = Histogram()
+            histogram.observe(duration_ms, rows)
+            exporters = self._exporters
+            slow_threshold_ms = self.slow_threshold_ms
+
+        if not exporters:
+            return
+        event = {'operation': operation, 'duration_ms': duration_ms, 'rows': rows,
+                 'query': ' '.join(query.split()) if query else None}
+        is_slow = slow_threshold_ms is not None and duration_ms >= slow_threshold_ms
+        for exporter in exporters:
+            exporter.export(event)
+            if is_slow:
+                exporter.export_slow(event)
+
+    @contextmanager
+    def timed(self, operation: str, query: str | None = None):
+        if not self.enabled:
+            yield _Span()
+            return
+        span = _Span()
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            self.record(operation, time.perf_counter() - started, span.rows, query)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {operation: histogram.to_dict() for operation, histogram in self._histograms.items()}
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def _count_rows(result) -> int | None:
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, bool):
+        return int(result)
+    if isinstance(result, int):
+        return result
+    return None
+
+
+def _query_argument(func, with_query: bool | int | str) -> tuple[str | None, int | None]:
+    # with_query=True - аргумент с именем query, иначе имя или позиция аргумента с запросом
+    if with_query is False or with_query is None:
+        return None, None
+    if isinstance(with_query, int) and not isinstance(with_query, bool):
+        return None, with_query
+    name = 'query' if with_query is True else with_query
+    parameters = list(inspect.signature(func).parameters)
+    if name not in parameters:
+        raise ValueError(f"{func.__qualname__} has no argument {name!r}")
+    return name, parameters.index(name)
+
+
+def instrumented(operation: str, with_query: bool | int | str = False, count_rows: bool = True):
+    def decorate(func):
+        query_name, query_index = _query_argument(func, with_query)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not INSTRUMENTATION.enabled:
+                return func(*args, **kwargs)
+            query = kwargs.get(query_name) if query_name is not None else None
+            if query is None and query_index is not None and query_index < len(args):
+                query = args[query_index]
+            rows = None
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                rows = _count_rows(result) if count_rows else None
+                return result
+            finally:
+                # Записываем и упавшие запросы, чтобы они попали в журнал медленных
+                INSTRUMENTATION.record(operation, time.perf_counter() - started, rows, query)
+        return wrapper
+    return decorate
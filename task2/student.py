@@ -1,7 +1,67 @@
+import hashlib
 import json
 import re
+import sys
+from functools import lru_cache
+from typing import List
+
+NAME_PATTERN = re.compile(r'^[A-Za-zА-Яа-я]+(?:-[A-Za-zА-Яа-я]+)*$')
+PHONE_PATTERN = re.compile(r'^\+7\d{10}$')
+
+REGION_TYPES = {'респ.': r'Респ\.', 'край': r'Край', 'обл.': r'Обл\.'}
+LOCATION_TYPES = {'г.': r'г\.', 'с.': r'с\.', 'ст-ца': r'ст-ца', 'а.': r'а\.'}
+# Один проход по адресу: lookahead находит и пересекающиеся вхождения
+ADDRESS_PATTERN = re.compile(
+    r'(?=(?P<region>Респ\.|Край|Обл\.)'
+    r'|(?P<location>г\.|с\.|ст-ца|а\.)'
+    r'|(?P<street>ул\.|улица|пр\.|проспект|бульвар|б-р|переулок|пер\.|аллея|шоссе)'
+    r'|(?P<house>(?:д\.|дом)\s*\d+))',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(value: str) -> str:
+    if not NAME_PATTERN.match(value):
+        raise ValueError("Invalid name format")
+    return sys.intern(value.title())
+
+
+@lru_cache(maxsize=16384)
+def _check_address(address: str) -> str:
+    regions = set()
+    locations = set()
+    has_street = False
+    has_house = False
+    for match in ADDRESS_PATTERN.finditer(address):
+        kind = match.lastgroup
+        if kind == 'region':
+            regions.add(match.group(kind).lower())
+        elif kind == 'location':
+            locations.add(match.group(kind).lower())
+        elif kind == 'street':
+            has_street = True
+        else:
+            has_house = True
+
+    if len(regions) > 1:
+        found = [pattern for token, pattern in REGION_TYPES.items() if token in regions]
+        raise ValueError(f"Адрес не может содержать одновременно {', '.join(found)}")
+    if len(locations) > 1:
+        found = [pattern for token, pattern in LOCATION_TYPES.items() if token in locations]
+        raise ValueError(f"Адрес не может содержать одновременно {', '.join(found)}")
+
+    if not has_street:
+        raise ValueError("Адрес должен содержать указание улицы")
+    if not has_house:
+        raise ValueError("Адрес должен содержать номер дома")
+
+    return address
+
 
 class Person:
+    __slots__ = ('_first_name', '_last_name', '_patronymic', '_address')
+
     def __init__(self, first_name: str, last_name: str, patronymic: str | None, address: str):
         self._first_name = self.validate_name(first_name)
         self._last_name = self.validate_name(last_name)
@@ -24,9 +84,7 @@ class Person:
             value = value.strip()
 
         if value is not None:
-            if not re.match(r'^[A-Za-zА-Яа-я]+(?:-[A-Za-zА-Яа-я]+)*$', value):
-                raise ValueError("Invalid name format")
-            value = value.title()
+            value = _normalize_name(value)
 
         return value
 
@@ -35,24 +93,7 @@ class Person:
         if not isinstance(address, str) or not address.strip():
             raise ValueError("Address must be a non-empty string")
 
-        address = address.strip()
-        region_types = [r'Респ\.', r'Край', r'Обл\.']
-        location_types = [r'г\.', r'с\.', r'ст-ца', r'а\.']
-
-        found_regions = [r for r in region_types if re.search(r, address, re.IGNORECASE)]
-        found_locations = [l for l in location_types if re.search(l, address, re.IGNORECASE)]
-
-        if len(found_regions) > 1:
-            raise ValueError(f"Адрес не может содержать одновременно {', '.join(found_regions)}")
-        if len(found_locations) > 1:
-            raise ValueError(f"Адрес не может содержать одновременно {', '.join(found_locations)}")
-
-        if not re.search(r'(ул\.|улица|пр\.|проспект|бульвар|б-р|переулок|пер\.|аллея|шоссе)', address, re.IGNORECASE):
-            raise ValueError("Адрес должен содержать указание улицы")
-        if not re.search(r'(д\.|дом)\s*\d+', address, re.IGNORECASE):
-            raise ValueError("Адрес должен содержать номер дома")
-
-        return address
+        return _check_address(address.strip())
 
     @property
     def first_name(self) -> str:
@@ -83,6 +124,8 @@ class Person:
 
 
 class Student(Person):
+    __slots__ = ('_student_id', '_phone', '_min_required_facultative_hours')
+
     def __init__(self, *args, **kwargs):
         if len(args) == 1:
             arg = args[0]
@@ -118,6 +161,32 @@ class Student(Person):
             data.get('min_required_facultative_hours', 0)
         )
 
+    @classmethod
+    def from_row(cls, row: tuple, verify: bool = False) -> 'Student':
+        if verify:
+            return cls(*row)
+
+        student_id, first_name, last_name, patronymic, address, phone, hours = row
+        if (not isinstance(student_id, int) or not isinstance(hours, int)
+                or not isinstance(first_name, str) or not isinstance(last_name, str)
+                or not isinstance(address, str) or not isinstance(patronymic, (str, type(None)))
+                or not isinstance(phone, (str, type(None)))):
+            raise ValueError(f"Invalid student row: {row!r}")
+
+        student = cls.__new__(cls)
+        student._student_id = student_id
+        student._first_name = sys.intern(first_name)
+        student._last_name = sys.intern(last_name)
+        student._patronymic = sys.intern(patronymic) if patronymic is not None else None
+        student._address = address
+        student._phone = phone
+        student._min_required_facultative_hours = hours
+        return student
+
+    @classmethod
+    def from_rows(cls, rows, verify: bool = False) -> List['Student']:
+        return [cls.from_row(row, verify) for row in rows]
+
     @staticmethod
     def _parse_string(input_string: str) -> dict:
         parts = input_string.split(';')
@@ -189,7 +258,7 @@ class Student(Person):
 
         phone = phone.strip()
 
-        if not re.match(r'^\+7\d{10}$', phone):
+        if not PHONE_PATTERN.match(phone):
             raise ValueError("Phone must start with +7 followed by exactly 10 digits")
 
         return phone
@@ -226,6 +295,17 @@ class Student(Person):
                 self._phone == other._phone and
                 self._min_required_facultative_hours == other._min_required_facultative_hours)
 
+    def content_hash(self) -> str:
+        # Должен совпадать с ROW_HASH_SQL в student_rep_db
+        return hashlib.md5('\x1f'.join((
+            self._first_name,
+            self._last_name,
+            self._patronymic or '',
+            self._address,
+            self._phone or '',
+            str(self._min_required_facultative_hours)
+        )).encode('utf-8')).hexdigest()
+
     @property
     def student_id(self) -> int:
         return self._student_id
@@ -0,0 +1,228 @@
+import re
+from functools import lru_cache
+from typing import List, Sequence
+import numpy as np
+from student import Student, REGION_TYPES, LOCATION_TYPES
+
+GROUPS = ('region', 'location')
+
+REGION_PART = re.compile(r'[^,]*(?<!\w)(?:' + '|'.join(REGION_TYPES.values()) + r')[^,]*', re.IGNORECASE)
+LOCATION_PART = re.compile(r'[^,]*(?<!\w)(?:' + '|'.join(LOCATION_TYPES.values()) + r')[^,]*', re.IGNORECASE)
+# Те же выражения для PostgreSQL: \m - начало слова, первая скобка - результат substring
+REGION_SQL_PATTERN = r'(?i)([^,]*\m(?:' + '|'.join(REGION_TYPES.values()) + r')[^,]*)'
+LOCATION_SQL_PATTERN = r'(?i)([^,]*\m(?:' + '|'.join(LOCATION_TYPES.values()) + r')[^,]*)'
+
+
+def _check_group(group_by: str) -> str:
+    if group_by not in GROUPS:
+        raise ValueError(f"Unknown group: {group_by}")
+    return group_by
+
+
+def _address_part(pattern: re.Pattern, address: str) -> str | None:
+    match = pattern.search(address)
+    return ' '.join(match.group().split()) if match else None
+
+
+@lru_cache(maxsize=16384)
+def address_groups(address: str) -> tuple[str | None, str | None]:
+    return _address_part(REGION_PART, address), _address_part(LOCATION_PART, address)
+
+
+def histogram_edges(bins: int | Sequence[float], low: float, high: float) -> List[float]:
+    if not isinstance(bins, int):
+        edges = [float(edge) for edge in bins]
+        if len(edges) < 2 or any(a > b for a, b in zip(edges, edges[1:])):
+            raise ValueError("Histogram edges must be increasing")
+        return edges
+    if bins < 1:
+        raise ValueError("Number of bins must be positive")
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1).tolist()
+
+
+def _group_key(item: tuple) -> tuple:
+    return item[0] is None, item[0] or ''
+
+
+class StudentColumns:
+    def __init__(self, ids: np.ndarray, hours: np.ndarray, regions: np.ndarray, locations: np.ndarray,
+                 region_names: List[str | None], location_names: List[str | None]):
+        self.ids = ids
+        self.hours = hours
+        self.codes = {'region': regions, 'location': locations}
+        self.names = {'region': region_names, 'location': location_names}
+
+    @classmethod
+    def from_students(cls, students: List[Student]) -> 'StudentColumns':
+        count = len(students)
+        ids = np.empty(count, dtype=np.int64)
+        hours = np.empty(count, dtype=np.int64)
+        regions = np.empty(count, dtype=np.int32)
+        locations = np.empty(count, dtype=np.int32)
+        region_codes = {}
+        location_codes = {}
+        for i, student in enumerate(students):
+            region, location = address_groups(student.address)
+            ids[i] = student.student_id
+            hours[i] = student.min_required_facultative_hours
+            regions[i] = region_codes.setdefault(region, len(region_codes))
+            locations[i] = location_codes.setdefault(location, len(location_codes))
+        return cls(ids, hours, regions, locations, list(region_codes), list(location_codes))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class StudentAnalytics:
+    def __init__(self, repository):
+        self._repository = repository
+        self._cached_version = None
+        self._cached_columns = None
+
+    def columns(self) -> StudentColumns:
+        version = getattr(self._repository, 'version', None)
+        if version is not None and version == self._cached_version:
+            return self._cached_columns
+
+        self._cached_columns = StudentColumns.from_students(self._repository.read_all())
+        self._cached_version = version
+        return self._cached_columns
+
+    def invalidate(self) -> None:
+        self._cached_version = None
+        self._cached_columns = None
+
+    def _selection(self, min_hours: int | None) -> tuple[StudentColumns, np.ndarray | None]:
+        columns = self.columns()
+        mask = columns.hours >= min_hours if min_hours is not None else None
+        return columns, mask
+
+    def _grouped(self, group_by: str, min_hours: int | None, weights: bool) -> dict:
+        columns, mask = self._selection(min_hours)
+        codes = columns.codes[_check_group(group_by)]
+        names = columns.names[group_by]
+        hours = columns.hours
+        if mask is not None:
+            codes, hours = codes[mask], hours[mask]
+        totals = np.bincount(codes, weights=hours if weights else None, minlength=len(names))
+        if weights:
+            counts = np.bincount(codes, minlength=len(names))
+            values = [(name, int(total)) for name, total, count in zip(names, totals, counts) if count]
+        else:
+            values = [(name, int(total)) for name, total in zip(names, totals) if total]
+        return dict(sorted(values, key=_group_key))
+
+    def count(self, min_hours: int | None = None) -> int:
+        columns, mask = self._selection(min_hours)
+        return int(mask.sum()) if mask is not None else len(columns)
+
+    def count_by(self, group_by: str, min_hours: int | None = None) -> dict:
+        return self._grouped(group_by, min_hours, weights=False)
+
+    def sum_by(self, group_by: str, min_hours: int | None = None) -> dict:
+        return self._grouped(group_by, min_hours, weights=True)
+
+    def histogram(self, bins: int | Sequence[float] = 10, min_hours: int | None = None) -> tuple[List[int], List[float]]:
+        columns, mask = self._selection(min_hours)
+        hours = columns.hours[mask] if mask is not None else columns.hours
+        low, high = (int(hours.min()), int(hours.max())) if len(hours) else (0, 1)
+        edges = histogram_edges(bins, low, high)
+        counts, _ = np.histogram(hours, bins=edges)
+        return counts.tolist(), edges
+
+    def percentiles(self, q: Sequence[float] = (50, 90, 99), group_by: str | None = None,
+                    min_hours: int | None = None) -> dict:
+        columns, mask = self._selection(min_hours)
+        hours = columns.hours
+        if group_by is None:
+            hours = hours[mask] if mask is not None else hours
+            return self._percentiles(hours, q)
+
+        codes = columns.codes[_check_group(group_by)]
+        if mask is not None:
+            codes, hours = codes[mask], hours[mask]
+        order = np.lexsort((hours, codes))
+        codes, hours = codes[order], hours[order]
+        bounds = np.searchsorted(codes, np.arange(len(columns.names[group_by]) + 1))
+        result = []
+        for code, name in enumerate(columns.names[group_by]):
+            start, end = bounds[code], bounds[code + 1]
+            if start < end:
+                result.append((name, self._percentiles(hours[start:end], q)))
+        return dict(sorted(result, key=_group_key))
+
+    @staticmethod
+    def _percentiles(hours: np.ndarray, q: Sequence[float]) -> dict:
+        if not len(hours):
+            return {value: None for value in q}
+        return dict(zip(q, np.percentile(hours, q).tolist()))
+
+
+class StudentAnalyticsDB:
+    def __init__(self):
+        from student_rep_db import DatabaseConnection
+        self._db = DatabaseConnection()
+
+    def _hours_query(self, group_by: str | None, min_hours: int | None) -> tuple[str, tuple]:
+        where, params = "TRUE", ()
+        if min_hours is not None:
+            where, params = "min_required_facultative_hours >= %s", (min_hours,)
+        if group_by is None:
+            return (f"SELECT min_required_facultative_hours AS hours FROM students WHERE {where}", params)
+        pattern = REGION_SQL_PATTERN if _check_group(group_by) == 'region' else LOCATION_SQL_PATTERN
+        return (f"""
+            SELECT regexp_replace(btrim(substring(address from %s)), '\\s+', ' ', 'g') AS grp,
+                   min_required_facultative_hours AS hours
+            FROM students WHERE {where}
+        """, (pattern, *params))
+
+    def count(self, min_hours: int | None = None) -> int:
+        query, params = self._hours_query(None, min_hours)
+        return self._db.execute_query(f"SELECT COUNT(*) FROM ({query}) AS selected", params)[0][0]
+
+    def count_by(self, group_by: str, min_hours: int | None = None) -> dict:
+        query, params = self._hours_query(group_by, min_hours)
+        rows = self._db.execute_query(f"SELECT grp, COUNT(*) FROM ({query}) AS selected GROUP BY grp", params)
+        return dict(sorted(((name, int(count)) for name, count in rows), key=_group_key))
+
+    def sum_by(self, group_by: str, min_hours: int | None = None) -> dict:
+        query, params = self._hours_query(group_by, min_hours)
+        rows = self._db.execute_query(f"SELECT grp, SUM(hours) FROM ({query}) AS selected GROUP BY grp", params)
+        return dict(sorted(((name, int(total)) for name, total in rows), key=_group_key))
+
+    def histogram(self, bins: int | Sequence[float] = 10, min_hours: int | None = None) -> tuple[List[int], List[float]]:
+        query, params = self._hours_query(None, min_hours)
+        low, high = 0, 1
+        if isinstance(bins, int):
+            low_value, high_value = self._db.execute_query(
+                f"SELECT MIN(hours), MAX(hours) FROM ({query}) AS selected", params)[0]
+            if low_value is not None:
+                low, high = low_value, high_value
+        edges = histogram_edges(bins, low, high)
+        rows = self._db.execute_query(f"""
+            SELECT CASE WHEN hours = %s THEN %s ELSE width_bucket(hours::float8, %s::float8[]) END AS bucket,
+                   COUNT(*)
+            FROM ({query}) AS selected
+            WHERE hours >= %s AND hours <= %s
+            GROUP BY bucket
+        """, (edges[-1], len(edges) - 1, edges, *params, edges[0], edges[-1]))
+        counts = [0] * (len(edges) - 1)
+        for bucket, count in rows:
+            counts[bucket - 1] += count
+        return counts, edges
+
+    def percentiles(self, q: Sequence[float] = (50, 90, 99), group_by: str | None = None,
+                    min_hours: int | None = None) -> dict:
+        fractions = [value / 100 for value in q]
+        query, params = self._hours_query(group_by, min_hours)
+        aggregate = "percentile_cont(%s::float8[]) WITHIN GROUP (ORDER BY hours)"
+        if group_by is None:
+            values = self._db.execute_query(f"SELECT {aggregate} FROM ({query}) AS selected",
+                                            (fractions, *params))[0][0]
+            return dict(zip(q, values or [None] * len(q)))
+
+        rows = self._db.execute_query(f"SELECT grp, {aggregate} FROM ({query}) AS selected GROUP BY grp",
+                                      (fractions, *params))
+        return dict(sorted(((name, dict(zip(q, values))) for name, values in rows), key=_group_key))
@@ -0,0 +1,131 @@
+import operator
+from typing import List
+from student import Student
+
+FIELDS = ('student_id', 'first_name', 'last_name', 'patronymic',
+          'address', 'phone', 'min_required_facultative_hours')
+NULLABLE_FIELDS = ('patronymic', 'phone')
+
+OPERATORS = {
+    'eq': ('=', operator.eq),
+    'ne': ('<>', operator.ne),
+    'lt': ('<', operator.lt),
+    'le': ('<=', operator.le),
+    'gt': ('>', operator.gt),
+    'ge': ('>=', operator.ge)
+}
+
+
+def _check_field(field: str) -> str:
+    if field not in FIELDS:
+        raise ValueError(f"Unknown student field: {field}")
+    return field
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class StudentFilter:
+    def __init__(self):
+        self._conditions = []
+
+    def where(self, field: str, op: str, value) -> 'StudentFilter':
+        _check_field(field)
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        if value is None and op not in ('eq', 'ne'):
+            raise ValueError("None can only be compared with 'eq' or 'ne'")
+        self._conditions.append((field, op, value))
+        return self
+
+    def prefix(self, field: str, prefix: str) -> 'StudentFilter':
+        _check_field(field)
+        if not isinstance(prefix, str):
+            raise ValueError("Prefix must be a string")
+        self._conditions.append((field, 'prefix', prefix))
+        return self
+
+    def last_name_prefix(self, prefix: str) -> 'StudentFilter':
+        return self.prefix('last_name', prefix)
+
+    def hours_between(self, low: int | None = None, high: int | None = None) -> 'StudentFilter':
+        if low is not None:
+            self.where('min_required_facultative_hours', 'ge', low)
+        if high is not None:
+            self.where('min_required_facultative_hours', 'le', high)
+        return self
+
+    def to_sql(self) -> tuple[str, tuple]:
+        clauses = []
+        params = []
+        for field, op, value in self._conditions:
+            if op == 'prefix':
+                clauses.append(f"{field} LIKE %s")
+                params.append(_escape_like(value) + '%')
+            elif value is None:
+                clauses.append(f"{field} IS NULL" if op == 'eq' else f"{field} IS NOT NULL")
+            else:
+                clauses.append(f"{field} {OPERATORS[op][0]} %s")
+                params.append(value)
+        return " AND ".join(clauses) or "TRUE", tuple(params)
+
+    def __call__(self, student: Student) -> bool:
+        for field, op, value in self._conditions:
+            actual = getattr(student, field)
+            if op == 'prefix':
+                if actual is None or not actual.startswith(value):
+                    return False
+            elif value is None:
+                if (actual is None) != (op == 'eq'):
+                    return False
+            elif actual is None:
+                return False
+            elif not OPERATORS[op][1](actual, value):
+                return False
+        return True
+
+
+class _Descending:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+class StudentSort:
+    def __init__(self, *fields: str):
+        if not fields:
+            raise ValueError("At least one sort field is required")
+        self._fields: List[tuple[str, bool]] = []
+        for field in fields:
+            descending = field.startswith('-')
+            self._fields.append((_check_field(field.lstrip('-')), descending))
+
+    @classmethod
+    def by_name(cls) -> 'StudentSort':
+        return cls('last_name', 'first_name', 'patronymic')
+
+    def to_sql(self) -> str:
+        parts = []
+        for field, descending in self._fields:
+            column = f"COALESCE({field}, '')" if field in NULLABLE_FIELDS else field
+            parts.append(f"{column} DESC" if descending else column)
+        if 'student_id' not in (field for field, _ in self._fields):
+            parts.append("student_id")
+        return ", ".join(parts)
+
+    def __call__(self, student: Student) -> tuple:
+        key = []
+        for field, descending in self._fields:
+            value = getattr(student, field)
+            if value is None and field in NULLABLE_FIELDS:
+                value = ""
+            key.append(_Descending(value) if descending else value)
+        return tuple(key)
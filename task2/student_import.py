@@ -0,0 +1,112 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, List
+from student import Student
+from student_repository import StudentRepository, StudentRepJson
+
+
+def _parse_record(record) -> tuple:
+    if isinstance(record, dict):
+        student = Student(**record)
+    else:
+        student = Student(record.strip() if isinstance(record, str) else record)
+    return (student.first_name, student.last_name, student.patronymic,
+            student.address, student.phone, student.min_required_facultative_hours)
+
+
+def _parse_chunk(chunk: list) -> tuple[list, list]:
+    rows = []
+    errors = []
+    for line_number, record in chunk:
+        try:
+            rows.append(_parse_record(record))
+        except (ValueError, KeyError, TypeError) as e:
+            errors.append((line_number, str(e)))
+    return rows, errors
+
+
+class ImportResult:
+    def __init__(self):
+        self.imported = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        total = self.imported + len(self.errors)
+        return total / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (f"Импортировано: {self.imported}, ошибок: {len(self.errors)}, "
+                f"{self.records_per_second:.0f} записей/с")
+
+
+class StudentImporter:
+    def __init__(self, repository: StudentRepository, batch_size: int = 1000,
+                 chunk_size: int = 2000, processes: int | None = None):
+        self._repository = repository
+        self._batch_size = batch_size
+        self._chunk_size = chunk_size
+        self._processes = processes
+
+    def import_file(self, filename: str) -> ImportResult:
+        if filename.endswith('.json'):
+            return self.import_records(StudentRepJson._iter_items(filename))
+
+        with open(filename, 'r', encoding='utf-8') as file:
+            # Нумеруем строки до пропуска пустых, чтобы ошибки ссылались на строки файла
+            return self._import(
+                (line_number, line) for line_number, line in enumerate(file, 1) if line.strip())
+
+    def import_records(self, records: Iterable) -> ImportResult:
+        return self._import(enumerate(records, 1))
+
+    def _import(self, numbered: Iterable[tuple]) -> ImportResult:
+        result = ImportResult()
+        started = time.perf_counter()
+        pending = []
+
+        with self._repository.transaction():
+            for rows, errors in self._parse(numbered):
+                result.errors.extend(errors)
+                pending.extend(rows)
+                while len(pending) >= self._batch_size:
+                    result.imported += self._store(pending[:self._batch_size])
+                    del pending[:self._batch_size]
+            if pending:
+                result.imported += self._store(pending)
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _chunks(self, numbered: Iterable[tuple]):
+        numbered = iter(numbered)
+        while True:
+            chunk = list(islice(numbered, self._chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _parse(self, numbered: Iterable[tuple]):
+        if self._processes is not None and self._processes <= 1:
+            for chunk in self._chunks(numbered):
+                yield _parse_chunk(chunk)
+            return
+
+        workers = self._processes or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight = deque()
+            max_in_flight = 2 * workers
+            for chunk in self._chunks(numbered):
+                in_flight.append(executor.submit(_parse_chunk, chunk))
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def _store(self, rows: List[tuple]) -> int:
+        # Строки уже проверены в _parse_record, повторная валидация не нужна
+        return len(self._repository.add_students(rows))
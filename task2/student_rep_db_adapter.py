@@ -1,66 +1,163 @@
-from student_repository import *
-from student_rep_db import *
+from typing import List
+from student import Student
+from student_cache import LRUCache
+from student_filter import StudentFilter, StudentSort
+from student_repository import StudentRepository
+from student_rep_db import StudentRepDB
 
 
 class StudentRepDBAdapter(StudentRepository):
-    def __init__(self, db_repo: StudentRepDB):
+    def __init__(self, db_repo: StudentRepDB, cache_size: int = 10000, cache_ttl: float | None = 30.0):
         self._db_repo = db_repo
+        self._entries = LRUCache(cache_size, cache_ttl)
+        self._queries = LRUCache(max(cache_size // 10, 1), cache_ttl)
         super().__init__("database")
 
     def _load(self) -> None:
-        count = self._db_repo.get_count()
-        self._students = self._db_repo.get_k_n_short_list(count, 1) if count > 0 else []
+        self._students = []
+        self._entries.clear()
+        self._queries.clear()
 
     def _save(self) -> None:
         pass
 
+    def _cache_students(self, students: List[Student]) -> None:
+        for student in students:
+            self._entries.put(student.student_id, student)
+
+    def _query(self, key: tuple, fetch):
+        result = self._queries.get(key)
+        if result is None:
+            result = fetch()
+            if isinstance(result, list):
+                self._cache_students(result)
+            self._queries.put(key, result)
+        return result
+
+    def invalidate(self, student_id: int | None = None) -> None:
+        if student_id is None:
+            self._load()
+            return
+        self._entries.invalidate(student_id)
+        self._queries.clear()
+        self._changed()
+
+    def cache_stats(self) -> dict:
+        return {'entries': self._entries.stats(), 'queries': self._queries.stats()}
+
     def read_all(self) -> List[Student]:
+        return self._query(('all',), lambda: list(self._db_repo.iter_all())).copy()
+
+    def write_all(self, students: List[Student], mode: str = 'truncate') -> None:
+        self._db_repo.write_all(students, mode)
         self._load()
-        return self._students.copy()
 
-    def write_all(self, students: List[Student]) -> None:
-        current_students = self._db_repo.get_k_n_short_list(self._db_repo.get_count(), 1)
-        for student in current_students:
-            self._db_repo.delete_student(student.student_id)
+    def get_by_id(self, student_id: int) -> Student | None:
+        student = self._entries.get(student_id)
+        if student is None:
+            student = self._db_repo.get_by_id(student_id)
+            if student is not None:
+                self._entries.put(student_id, student)
+        return student
+
+    def get_by_ids(self, student_ids: List[int], use_cache: bool = True) -> List[Student]:
+        found = {}
+        missing = []
+        for student_id in dict.fromkeys(student_ids):
+            student = self._entries.get(student_id) if use_cache else None
+            if student is None:
+                missing.append(student_id)
+            else:
+                found[student_id] = student
+        if missing:
+            fetched = self._db_repo.get_by_ids(missing)
+            self._cache_students(fetched)
+            found.update((student.student_id, student) for student in fetched)
+        return [found[student_id] for student_id in dict.fromkeys(student_ids) if student_id in found]
 
-        for student in students:
-            self._db_repo.add_student({
-                'first_name': student.first_name,
-                'last_name': student.last_name,
-                'patronymic': student.patronymic,
-                'address': student.address,
-                'phone': student.phone,
-                'min_required_facultative_hours': student.min_required_facultative_hours
-            })
-        self._students = students.copy()
+    def find_by_last_name(self, last_name: str) -> List[Student]:
+        student_filter = StudentFilter().where('last_name', 'eq', Student.validate_name(last_name))
+        return self._query(('last_name', student_filter.to_sql()),
+                           lambda: list(self._db_repo.iter_all(student_filter=student_filter))).copy()
 
-    def get_by_id(self, student_id: int) -> Student | None:
-        return self._db_repo.get_by_id(student_id)
+    def get_by_phone(self, phone: str) -> Student | None:
+        student_filter = StudentFilter().where('phone', 'eq', Student.validate_phone(phone))
+        students = self._query(('phone', student_filter.to_sql()),
+                               lambda: self._db_repo.get_k_n_short_list(1, 1, student_filter))
+        return students[0] if students else None
+
+    def get_k_n_short_list(self, k: int, n: int) -> List[Student]:
+        return self._query(('page', k, n), lambda: self._db_repo.get_k_n_short_list(k, n)).copy()
+
+    def get_k_n_sorted(self, k: int, n: int) -> List[Student]:
+        return self._query(('sorted_page', k, n),
+                           lambda: self._db_repo.get_k_n_short_list(k, n, student_sort=StudentSort.by_name())).copy()
+
+    def find_by_last_name_prefix(self, prefix: str, limit: int = 10) -> List[Student]:
+        student_filter = StudentFilter().last_name_prefix(prefix.strip().title())
+        return self._query(('prefix', student_filter.to_sql(), limit),
+                           lambda: self._db_repo.get_k_n_short_list(limit, 1, student_filter,
+                                                                    StudentSort.by_name())).copy()
 
     def add_student(self, student_data: dict) -> Student:
         student = self._db_repo.add_student(student_data)
-        self._load()
+        self._entries.put(student.student_id, student)
+        self._queries.clear()
+        self._changed()
+        self._notify('add', student)
         return student
 
+    def add_students(self, rows: List[tuple]) -> List[Student]:
+        students = self._db_repo.add_students(rows)
+        self._cache_students(students)
+        self._queries.clear()
+        self._changed()
+        for student in students:
+            self._notify('add', student)
+        return students
+
     def update_student(self, student_id: int, student_data: dict) -> Student | None:
         result = self._db_repo.update_student(student_id, student_data)
-        self._load()
+        if result is not None:
+            self._entries.put(student_id, result)
+        else:
+            self._entries.invalidate(student_id)
+        self._queries.clear()
+        self._changed()
+        if result is not None:
+            self._notify('update', result)
         return result
 
     def delete_student(self, student_id: int) -> bool:
         result = self._db_repo.delete_student(student_id)
-        self._load()
+        self.invalidate(student_id)
+        if result:
+            self._notify('delete', student_id)
         return result
 
+    def get_row_hashes(self, student_ids: List[int] | None = None) -> dict:
+        return self._db_repo.get_row_hashes(student_ids)
+
+    def change_cursor(self) -> int | None:
+        return self._db_repo.change_cursor()
+
+    def changed_ids(self, cursor: int) -> List[int]:
+        return self._db_repo.changed_ids(cursor)
+
+    def apply_changes(self, upserts: List[Student], deletes: List[int] = ()) -> None:
+        self._db_repo.apply_changes(upserts, deletes)
+        for student_id in deletes:
+            self._entries.invalidate(student_id)
+        self._cache_students(upserts)
+        self._queries.clear()
+        self._changed()
+        for student_id in deletes:
+            self._notify('delete', student_id)
+        for student in upserts:
+            self._notify('update', student)
+
     def get_count(self) -> int:
-        return self._db_repo.get_count()
+        return self._query(('count',), self._db_repo.get_count)
 
     def sort_by_name(self) -> List[Student]:
-        count = self._db_repo.get_count()
-        self._students = self._db_repo.get_k_n_short_list(count, 1) if count > 0 else []
-        self._students.sort(key=lambda x: (
-            x.last_name,
-            x.first_name,
-            x.patronymic if x.patronymic else ""
-        ))
-        return self._students.copy()
+        return self._query(('sorted',), lambda: list(self._db_repo.iter_all(by_name=True))).copy()
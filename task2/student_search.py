@@ -0,0 +1,166 @@
+import heapq
+import re
+import threading
+from typing import List
+from student import Student
+
+SEARCH_FIELDS = {
+    'name': ('last_name', 'first_name', 'patronymic'),
+    'address': ('address',)
+}
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def _check_field(field: str | None) -> tuple:
+    if field is None:
+        return tuple(SEARCH_FIELDS)
+    if field not in SEARCH_FIELDS:
+        raise ValueError(f"Unknown search field: {field}")
+    return (field,)
+
+
+def words(text: str) -> List[str]:
+    return WORD_PATTERN.findall(text.lower())
+
+
+def trigrams(word: str) -> frozenset:
+    # Как в pg_trgm: два пробела перед словом и один после
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class StudentSearchIndex:
+    def __init__(self, repository=None, threshold: float = 0.3):
+        self._threshold = threshold
+        self._lock = threading.RLock()
+        self._repository = repository
+        self._students = {}
+        self._student_words = {}
+        self._postings = {field: {} for field in SEARCH_FIELDS}
+        self._word_grams = {}
+        self._word_refs = {}
+        self._gram_words = {}
+        self._stale = repository is not None
+        if repository is not None:
+            repository.add_listener(self._on_change)
+
+    def _on_change(self, op: str, payload) -> None:
+        with self._lock:
+            if self._stale:
+                return
+            if op == 'add':
+                self.add(payload)
+            elif op == 'update':
+                self.remove(payload.student_id)
+                self.add(payload)
+            elif op == 'delete':
+                self.remove(payload)
+            else:
+                self._stale = True
+
+    def _ensure_built(self) -> None:
+        if self._stale:
+            self.rebuild(self._repository.read_all())
+
+    def rebuild(self, students: List[Student]) -> None:
+        with self._lock:
+            self._students = {}
+            self._student_words = {}
+            self._postings = {field: {} for field in SEARCH_FIELDS}
+            self._word_grams = {}
+            self._word_refs = {}
+            self._gram_words = {}
+            self._stale = False
+            for student in students:
+                self.add(student)
+
+    def close(self) -> None:
+        if self._repository is not None:
+            self._repository.remove_listener(self._on_change)
+
+    def _add_word(self, word: str) -> None:
+        if word in self._word_refs:
+            self._word_refs[word] += 1
+            return
+        self._word_refs[word] = 1
+        grams = self._word_grams[word] = trigrams(word)
+        for gram in grams:
+            self._gram_words.setdefault(gram, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        self._word_refs[word] -= 1
+        if self._word_refs[word]:
+            return
+        del self._word_refs[word]
+        for gram in self._word_grams.pop(word):
+            gram_words = self._gram_words[gram]
+            gram_words.discard(word)
+            if not gram_words:
+                del self._gram_words[gram]
+
+    def add(self, student: Student) -> None:
+        with self._lock:
+            if student.student_id in self._students:
+                self.remove(student.student_id)
+            entries = []
+            for field, attributes in SEARCH_FIELDS.items():
+                for attribute in attributes:
+                    value = getattr(student, attribute)
+                    if value:
+                        entries.extend((field, word) for word in words(value))
+            entries = list(dict.fromkeys(entries))
+            for field, word in entries:
+                self._postings[field].setdefault(word, set()).add(student.student_id)
+                self._add_word(word)
+            self._students[student.student_id] = student
+            self._student_words[student.student_id] = entries
+
+    def remove(self, student_id: int) -> None:
+        with self._lock:
+            if self._students.pop(student_id, None) is None:
+                return
+            for field, word in self._student_words.pop(student_id):
+                postings = self._postings[field]
+                postings[word].discard(student_id)
+                if not postings[word]:
+                    del postings[word]
+                self._remove_word(word)
+
+    def _similar_words(self, word: str) -> List[tuple[str, float]]:
+        grams = trigrams(word)
+        common = {}
+        for gram in grams:
+            for candidate in self._gram_words.get(gram, ()):
+                common[candidate] = common.get(candidate, 0) + 1
+        matches = []
+        for candidate, count in common.items():
+            score = count / (len(grams) + len(self._word_grams[candidate]) - count)
+            if score >= self._threshold:
+                matches.append((candidate, score))
+        return matches
+
+    def search(self, query: str, k: int = 10, field: str | None = None) -> List[tuple[Student, float]]:
+        fields = _check_field(field)
+        query_words = words(query)
+        if not query_words:
+            return []
+
+        with self._lock:
+            self._ensure_built()
+            scores = {}
+            for query_word in query_words:
+                best = {}
+                for word, score in self._similar_words(query_word):
+                    for search_field in fields:
+                        for student_id in self._postings[search_field].get(word, ()):
+                            if score > best.get(student_id, 0.0):
+                                best[student_id] = score
+                for student_id, score in best.items():
+                    scores[student_id] = scores.get(student_id, 0.0) + score / len(query_words)
+
+            top = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+            return [(self._students[student_id], score) for student_id, score in top]
+
+    def __len__(self) -> int:
+        self._ensure_built()
+        return len(self._students)
@@ -0,0 +1,142 @@
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from typing import List
+from instrumentation import INSTRUMENTATION
+
+
+def _recoverable_errors() -> tuple:
+    errors = [OSError, ValueError]
+    psycopg2 = sys.modules.get('psycopg2')
+    if psycopg2 is not None:
+        errors.append(psycopg2.Error)
+    student_rep_db = sys.modules.get('student_rep_db')
+    if student_rep_db is not None:
+        errors.append(student_rep_db.PoolTimeoutError)
+    return tuple(errors)
+
+
+class SyncResult:
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.deleted = 0
+        self.skipped = False
+        self.elapsed = 0.0
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+    def __str__(self) -> str:
+        if self.skipped:
+            return "Изменений нет"
+        return (f"Добавлено: {self.inserted}, обновлено: {self.updated}, удалено: {self.deleted} "
+                f"за {self.elapsed:.3f} с")
+
+
+class StudentSync:
+    def __init__(self, source, target, batch_size: int = 1000):
+        self._source = source
+        self._target = target
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._source_cursor = None
+        self._source_hashes = None
+        self._target_cursor = None
+        self._target_hashes = None
+
+    @staticmethod
+    def _cursor(repository) -> int | None:
+        change_cursor = getattr(repository, 'change_cursor', None)
+        return change_cursor() if change_cursor else None
+
+    def diff(self, source_hashes: dict, target_hashes: dict) -> tuple[List[int], List[int], List[int]]:
+        inserts = [student_id for student_id in source_hashes if student_id not in target_hashes]
+        updates = [student_id for student_id, content_hash in source_hashes.items()
+                   if student_id in target_hashes and target_hashes[student_id] != content_hash]
+        deletes = [student_id for student_id in target_hashes if student_id not in source_hashes]
+        return inserts, updates, deletes
+
+    @staticmethod
+    def _hashes(repository, cursor, cached_cursor, cached_hashes: dict | None) -> dict:
+        if cached_hashes is not None and cursor is not None and cursor == cached_cursor:
+            return cached_hashes
+        changed_ids = getattr(repository, 'changed_ids', None)
+        if changed_ids is None or cached_hashes is None or cached_cursor is None:
+            return repository.get_row_hashes()
+        # Пересчитываем хеши только для студентов, измененных после прошлого курсора
+        student_ids = changed_ids(cached_cursor)
+        hashes = dict(cached_hashes)
+        for student_id in student_ids:
+            hashes.pop(student_id, None)
+        hashes.update(repository.get_row_hashes(student_ids))
+        return hashes
+
+    def sync(self) -> SyncResult:
+        result = SyncResult()
+        started = time.perf_counter()
+        with self._lock, INSTRUMENTATION.timed('sync') as span:
+            source_cursor = self._cursor(self._source)
+            target_cursor = self._cursor(self._target)
+            if (source_cursor is not None and source_cursor == self._source_cursor
+                    and target_cursor is not None and target_cursor == self._target_cursor):
+                result.skipped = True
+                span.rows = 0
+                return result
+
+            source_hashes = self._hashes(self._source, source_cursor, self._source_cursor, self._source_hashes)
+            target_hashes = dict(self._hashes(self._target, target_cursor, self._target_cursor,
+                                              self._target_hashes))
+            inserts, updates, deletes = self.diff(source_hashes, target_hashes)
+
+            changed_ids = inserts + updates
+            transaction = getattr(self._target, 'transaction', nullcontext)
+            with transaction():
+                for start in range(0, max(len(changed_ids), len(deletes)), self._batch_size):
+                    batch_ids = changed_ids[start:start + self._batch_size]
+                    batch_deletes = deletes[start:start + self._batch_size]
+                    students = self._source.get_by_ids(batch_ids, use_cache=False)
+                    self._target.apply_changes(students, batch_deletes)
+                    for student_id in batch_deletes:
+                        target_hashes.pop(student_id, None)
+                    for student in students:
+                        target_hashes[student.student_id] = student.content_hash()
+
+            result.inserted = len(inserts)
+            result.updated = len(updates)
+            result.deleted = len(deletes)
+            span.rows = result.changed
+
+            self._target_hashes = target_hashes
+            self._source_hashes = source_hashes
+            self._source_cursor = source_cursor
+            # Курсор журнала изменений берем до применения: свои изменения перечитаются,
+            # но чужие, сделанные во время синхронизации, не потеряются
+            if hasattr(self._target, 'changed_ids'):
+                self._target_cursor = target_cursor
+            else:
+                self._target_cursor = self._cursor(self._target)
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._source_cursor = None
+            self._source_hashes = None
+            self._target_cursor = None
+            self._target_hashes = None
+
+    def run(self, interval: float = 5.0, stop_event: threading.Event | None = None,
+            on_result=None) -> None:
+        stop_event = stop_event or threading.Event()
+        while True:
+            try:
+                result = self.sync()
+                if on_result is not None:
+                    on_result(result)
+            except _recoverable_errors() as e:
+                print(f"Ошибка синхронизации: {e}")
+            if stop_event.wait(interval):
+                return
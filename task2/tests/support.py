@@ -0,0 +1,29 @@
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), 'benchmarks'))
+
+import package_path
+
+package_path.install()
+
+from data_gen import make_records, as_row
+from student import Student
+
+
+def make_students(count: int, seed: int = 1) -> list:
+    return Student.from_rows([as_row(record) for record in make_records(count, seed)])
+
+
+def student_data(**changes) -> dict:
+    data = {
+        'first_name': 'Иван',
+        'last_name': 'Петров',
+        'patronymic': None,
+        'address': 'г. Краснодар, ул. Красная, д. 1',
+        'phone': None,
+        'min_required_facultative_hours': 0
+    }
+    data.update(changes)
+    return data
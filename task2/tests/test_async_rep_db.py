@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from support import make_students, student_data
+from student import Student
+from student_filter import StudentFilter, StudentSort
+from student_rep_db import StudentRepDB
+from async_student_rep_db import AsyncStudentRepDB
+from decorators import AsyncStudentRepDBDecorator
+
+
+class FakeStudentRepDB:
+    # Замена StudentRepDB в памяти с теми же методами, что вызывает AsyncStudentRepDB
+    def __init__(self, students=(), delay: float = 0.0):
+        self._students = {student.student_id: student for student in students}
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def _call(self):
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(self._delay)
+        with self._lock:
+            self._active -= 1
+
+    def _selected(self, student_filter: StudentFilter | None) -> list:
+        students = sorted(self._students.values(), key=lambda student: student.student_id)
+        return [student for student in students if student_filter is None or student_filter(student)]
+
+    def get_by_id(self, student_id: int) -> Student | None:
+        self._call()
+        return self._students.get(student_id)
+
+    def get_by_ids(self, student_ids, use_cache: bool = True) -> list:
+        return [self._students[student_id] for student_id in dict.fromkeys(student_ids)
+                if student_id in self._students]
+
+    def get_k_n_short_list(self, k: int, n: int, student_filter=None, student_sort=None) -> list:
+        students = self._selected(student_filter)
+        if student_sort is not None:
+            students.sort(key=lambda student: (student_sort(student), student.student_id))
+        return students[(n - 1) * k:n * k]
+
+    def get_k_after_id(self, k: int, after_id: int | None = None, student_filter=None) -> list:
+        students = [student for student in self._selected(student_filter)
+                    if student.student_id > (after_id or 0)]
+        return students[:k]
+
+    def get_k_after_name(self, k: int, after: tuple | None = None, student_filter=None) -> list:
+        students = sorted(self._selected(student_filter), key=StudentRepDB.name_key)
+        if after is not None:
+            students = [student for student in students if StudentRepDB.name_key(student) > after]
+        return students[:k]
+
+    def add_student(self, student_data: dict) -> Student:
+        student = Student(student_id=max(self._students, default=0) + 1, **student_data)
+        self._students[student.student_id] = student
+        return student
+
+    def update_student(self, student_id: int, student_data: dict) -> Student | None:
+        if student_id not in self._students:
+            return None
+        student = self._students[student_id] = Student(student_id=student_id, **student_data)
+        return student
+
+    def delete_student(self, student_id: int) -> bool:
+        return self._students.pop(student_id, None) is not None
+
+    def get_count(self, student_filter=None) -> int:
+        return len(self._selected(student_filter))
+
+    def write_all(self, students, mode: str = 'truncate') -> None:
+        self._students = {student.student_id: student for student in students}
+
+
+class AsyncStudentRepDBTest(unittest.TestCase):
+    def setUp(self):
+        self.students = make_students(50)
+        self.fake = FakeStudentRepDB(self.students)
+        self.repo = AsyncStudentRepDB(self.fake, max_workers=4, batch_size=7)
+
+    def tearDown(self):
+        self.repo.close()
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_crud(self):
+        async def scenario():
+            added = await self.repo.add_student(student_data())
+            updated = await self.repo.update_student(added.student_id, student_data(last_name='Сидоров'))
+            fetched = await self.repo.get_by_id(added.student_id)
+            deleted = await self.repo.delete_student(added.student_id)
+            return added, updated, fetched, deleted, await self.repo.get_count()
+
+        added, updated, fetched, deleted, count = self.run_async(scenario())
+        self.assertEqual(added.student_id, 51)
+        self.assertEqual(updated.last_name, 'Сидоров')
+        self.assertEqual(fetched, updated)
+        self.assertTrue(deleted)
+        self.assertEqual(count, 50)
+
+    def test_concurrent_requests_run_in_parallel(self):
+        self.fake._delay = 0.05
+
+        async def scenario():
+            return await self.repo.pipeline(*(self.repo.get_by_id(student_id) for student_id in range(1, 9)))
+
+        students = self.run_async(scenario())
+        self.assertEqual([student.student_id for student in students], list(range(1, 9)))
+        self.assertGreater(self.fake.max_active, 1)
+
+    def test_iter_all_pages_by_id_and_name(self):
+        student_filter = StudentFilter().hours_between(10, 60)
+
+        async def collect(**kwargs):
+            return [student async for student in self.repo.iter_all(**kwargs)]
+
+        expected = [student for student in self.students if student_filter(student)]
+        by_id = self.run_async(collect(student_filter=student_filter))
+        by_name = self.run_async(collect(by_name=True, student_filter=student_filter))
+        self.assertEqual(by_id, expected)
+        self.assertEqual(by_name, sorted(expected, key=StudentRepDB.name_key))
+
+
+class AsyncStudentRepDBDecoratorTest(unittest.TestCase):
+    def setUp(self):
+        self.students = make_students(40)
+        self.repo = AsyncStudentRepDB(FakeStudentRepDB(self.students), max_workers=2, batch_size=6)
+
+    def tearDown(self):
+        self.repo.close()
+
+    def test_sql_filter_and_sort(self):
+        student_filter = StudentFilter().hours_between(20, None)
+        decorator = AsyncStudentRepDBDecorator(self.repo, student_filter, StudentSort('-min_required_facultative_hours'))
+        expected = sorted((student for student in self.students if student_filter(student)),
+                          key=lambda student: (-student.min_required_facultative_hours, student.student_id))
+
+        page = asyncio.run(decorator.get_k_n_short_list(5, 2))
+        self.assertEqual(page, expected[5:10])
+        self.assertEqual(asyncio.run(decorator.get_count()), len(expected))
+
+    def test_python_filter_and_sort(self):
+        decorator = AsyncStudentRepDBDecorator(self.repo, lambda student: student.student_id % 3 == 0,
+                                               lambda student: student.last_name, batch_size=4)
+        selected = [student for student in self.students if student.student_id % 3 == 0]
+
+        page = asyncio.run(decorator.get_k_n_short_list(4, 2))
+        self.assertEqual(page, sorted(selected, key=lambda student: student.last_name)[4:8])
+        self.assertEqual(asyncio.run(decorator.get_count()), len(selected))
+        self.assertEqual(asyncio.run(decorator.get_page_after(3, 10)),
+                         [student for student in selected if student.student_id > 10][:3])
+        by_ids = asyncio.run(decorator.get_by_ids([9, 3, 4, 6]))
+        self.assertEqual(by_ids, sorted((self.students[i - 1] for i in (9, 3, 6)),
+                                        key=lambda student: student.last_name))
+
+
+if __name__ == '__main__':
+    unittest.main()
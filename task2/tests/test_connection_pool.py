@@ -0,0 +1,97 @@
+import threading
+import unittest
+
+import support  # noqa: F401
+from student_rep_db import ConnectionPool, PoolTimeoutError
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None):
+        self._connection.queries.append(query)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.queries = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.connections = []
+
+    def connect(self) -> FakeConnection:
+        connection = FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+    def test_reuses_idle_connections(self):
+        pool = ConnectionPool(self.connect, min_size=1, max_size=2, timeout=1.0)
+        first = pool.getconn()
+        pool.putconn(first)
+        self.assertIs(pool.getconn(), first)
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(first.rollbacks, 1)
+
+    def test_times_out_when_exhausted(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1, timeout=0.05)
+        pool.getconn()
+        with self.assertRaises(PoolTimeoutError):
+            pool.getconn()
+
+    def test_waiter_gets_returned_connection(self):
+        pool = ConnectionPool(self.connect, min_size=0, max_size=1, timeout=2.0)
+        connection = pool.getconn()
+        received = []
+        waiter = threading.Thread(target=lambda: received.append(pool.getconn()))
+        waiter.start()
+        pool.putconn(connection)
+        waiter.join()
+        self.assertEqual(received, [connection])
+        self.assertEqual(pool.stats()['size'], 1)
+
+    def test_closed_connection_is_replaced(self):
+        pool = ConnectionPool(self.connect, min_size=1, max_size=1, timeout=1.0)
+        connection = pool.getconn()
+        connection.close()
+        pool.putconn(connection)
+        replacement = pool.getconn()
+        self.assertIsNot(replacement, connection)
+        self.assertEqual(pool.stats()['size'], 1)
+
+    def test_stale_idle_connection_is_checked(self):
+        pool = ConnectionPool(self.connect, min_size=1, max_size=1, timeout=1.0, health_check_interval=0.0)
+        connection = pool.getconn()
+        self.assertEqual(connection.queries, ["SELECT 1"])
+
+    def test_failed_connect_releases_slot(self):
+        def failing_connect():
+            raise OSError("no server")
+
+        pool = ConnectionPool(failing_connect, min_size=0, max_size=1, timeout=0.05)
+        with self.assertRaises(OSError):
+            pool.getconn()
+        self.assertEqual(pool.stats()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
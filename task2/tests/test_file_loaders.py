@@ -0,0 +1,133 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from support import make_students, student_data
+from student_repository import (StudentRepJson, StudentRepYaml, StudentRepJournal, StudentRepBinary,
+                                BinarySnapshotReader)
+
+
+def by_id(students) -> list:
+    return sorted(students, key=lambda student: student.student_id)
+
+
+class FileLoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.students = make_students(300)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+
+class StreamingLoaderTest(FileLoaderTestCase):
+    def round_trip(self, cls, name: str) -> list:
+        cls(self.path(name)).write_all(self.students)
+        return cls(self.path(name)).read_all()
+
+    def test_json_round_trip_across_chunk_boundaries(self):
+        with mock.patch.object(StudentRepJson, 'CHUNK_SIZE', 97):
+            self.assertEqual(self.round_trip(StudentRepJson, 'students.json'), self.students)
+
+    def test_json_lines_round_trip(self):
+        self.assertEqual(self.round_trip(StudentRepJson, 'students.jsonl'), self.students)
+
+    def test_yaml_round_trip(self):
+        self.assertEqual(self.round_trip(StudentRepYaml, 'students.yaml'), self.students)
+
+    def test_binary_round_trip(self):
+        self.assertEqual(self.round_trip(StudentRepBinary, 'students.bin'), self.students)
+
+    def test_binary_value_with_nul(self):
+        filename = self.path('students.bin')
+        repository = StudentRepBinary(filename)
+        repository.add_student(student_data())
+        repository.add_student(student_data(address='г. Краснодар,\x00 ул. Красная, д. 2'))
+        repository.add_student(student_data(address='г. Краснодар, ул. Красная, д. 3', phone='+79990001122'))
+
+        with BinarySnapshotReader(filename) as reader:
+            self.assertEqual(reader.rows(), [reader.row(index) for index in range(3)])
+        self.assertEqual(StudentRepBinary(filename).read_all(), repository.read_all())
+
+    def test_torn_json_lines_record_is_skipped(self):
+        filename = self.path('students.jsonl')
+        StudentRepJson(filename).write_all(self.students[:3])
+        with open(filename, 'a', encoding='utf-8') as file:
+            file.write('{"student_id": 4, "first_na')
+
+        with mock.patch('builtins.print'):
+            repository = StudentRepJson(filename)
+        self.assertEqual(repository.read_all(), self.students[:3])
+
+    def test_invalid_record_is_skipped(self):
+        filename = self.path('students.json')
+        StudentRepJson(filename).write_all(self.students[:2])
+        with open(filename, encoding='utf-8') as file:
+            items = json.load(file)
+        items.insert(1, dict(items[0], student_id=99, first_name=None))
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(items, file, ensure_ascii=False)
+
+        with mock.patch('builtins.print') as printed:
+            self.assertEqual(StudentRepJson(filename).read_all(), self.students[:2])
+        printed.assert_called_once()
+
+
+class JournalReplayTest(FileLoaderTestCase):
+    def test_replay_applies_adds_updates_and_deletes(self):
+        filename = self.path('students.log')
+        repository = StudentRepJournal(filename, compact_every=10000)
+        for _ in range(3):
+            repository.add_student(student_data())
+        repository.update_student(2, student_data(last_name='Сидоров'))
+        repository.delete_student(1)
+
+        reloaded = StudentRepJournal(filename)
+        self.assertEqual(by_id(reloaded.read_all()), by_id(repository.read_all()))
+        self.assertEqual(reloaded.get_by_id(2).last_name, 'Сидоров')
+
+    def test_stale_journal_is_not_replayed_after_interrupted_compaction(self):
+        filename = self.path('students.log')
+        repository = StudentRepJournal(filename, compact_every=10000)
+        repository.add_student(student_data())
+        repository.add_student(student_data())
+        repository.delete_student(1)
+
+        atomic_write = StudentRepJournal._atomic_write
+        calls = []
+
+        def interrupted(self, write, filename=None, binary=False):
+            calls.append(filename)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            atomic_write(self, write, filename, binary)
+
+        with mock.patch.object(StudentRepJournal, '_atomic_write', interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                repository.compact()
+
+        self.assertEqual([student.student_id for student in StudentRepJournal(filename).read_all()], [2])
+
+
+class SharedRepositoryTest(FileLoaderTestCase):
+    def test_writes_from_another_instance_are_visible(self):
+        filename = self.path('students.json')
+        first = StudentRepJson(filename, shared=True)
+        second = StudentRepJson(filename, shared=True)
+
+        first.add_student(student_data())
+        added = second.add_student(student_data(last_name='Сидоров'))
+
+        self.assertEqual(added.student_id, 2)
+        self.assertTrue(first.refresh())
+        self.assertEqual([student.last_name for student in first.read_all()], ['Петров', 'Сидоров'])
+
+
+if __name__ == '__main__':
+    unittest.main()